@@ -35,6 +35,9 @@ from .tools import add_suffix, make_link, expand_part
 # -------------------------------------------------------------------
 #  Output Redirection
 # -------------------------------------------------------------------
+# log files are flushed on exit, so a large buffer only saves write calls
+_log_buffer_size = 131072
+
 # original source: http://stackoverflow.com/questions/6796492/python-temporarily-redirect-stdout-stderr
 class output(object):
     ''' with SU2.io.redirect_output(stdout,stderr)
@@ -61,10 +64,10 @@ class output(object):
         _newerr = False
 
         if isinstance(stdout,str):
-            stdout = open(stdout,'a')
+            stdout = open(stdout,'a',buffering=_log_buffer_size)
             _newout = True
         if isinstance(stderr,str):
-            stderr = open(stderr,'a')
+            stderr = open(stderr,'a',buffering=_log_buffer_size)
             _newerr = True
 
         self._stdout = stdout or sys.stdout
@@ -26,32 +26,28 @@
 # License along with SU2. If not, see <http://www.gnu.org/licenses/>.
 # imports
 import numpy as np
-from optparse import OptionParser
+from argparse import ArgumentParser
 import os
 import sys
 import shutil
-import copy
+import pickle
 import os.path
 sys.path.append(os.environ['SU2_RUN'])
 import SU2
 
 def main():
 # Command Line Options
-    parser = OptionParser()
-    parser.add_option("-f", "--file", dest="filename",
-                      help="read config from FILE", metavar="FILE")
-    parser.add_option("-n", "--partitions", dest="partitions", default=1,
-                      help="number of PARTITIONS", metavar="PARTITIONS")
-    parser.add_option("-u", "--underRelaxation", dest="uq_urlx", default=0.1,
-                      help="under relaxation factor", metavar="UQ_URLX")
-    parser.add_option("-b", "--deltaB", dest="uq_delta_b", default=1.0,
-                      help="magnitude of perturbation", metavar="UQ_DELTA_B")
-
-    (options, args)=parser.parse_args()
-    options.partitions = int( options.partitions )
-    # check the typecasting
-    options.beta_delta = float( options.uq_delta_b )
-    options.urlx = float(options.uq_urlx)
+    parser = ArgumentParser()
+    parser.add_argument("-f", "--file", dest="filename",
+                        help="read config from FILE", metavar="FILE")
+    parser.add_argument("-n", "--partitions", dest="partitions", default=1, type=int,
+                        help="number of PARTITIONS", metavar="PARTITIONS")
+    parser.add_argument("-u", "--underRelaxation", dest="uq_urlx", default=0.1, type=float,
+                        help="under relaxation factor", metavar="UQ_URLX")
+    parser.add_argument("-b", "--deltaB", dest="uq_delta_b", default=1.0, type=float,
+                        help="magnitude of perturbation", metavar="UQ_DELTA_B")
+
+    options = parser.parse_args()
 
     # load config, start state
     config = SU2.io.Config(options.filename)
@@ -63,26 +59,36 @@ def main():
     # prepare config
     config.NUMBER_PART = options.partitions
     config.SST_OPTIONS = 'UQ'
-    config.UQ_DELTA_B = options.beta_delta
-    config.UQ_URLX = options.urlx
+    config.UQ_DELTA_B = options.uq_delta_b
+    config.UQ_URLX = options.uq_urlx
     config.UQ_PERMUTE = 'NO'
 
+    # serialize the baseline once, each perturbation restores its own copy
+    config_blob = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+    state_blob  = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # perturbations to run: (banner label, component, permute, output folder)
+    perturbations = [ ('1'   , 1, 'NO' , '1c/'  ) ,
+                      ('2'   , 2, 'NO' , '2c/'  ) ,
+                      ('3'   , 3, 'NO' , '3c/'  ) ,
+                      ('p1c1', 1, 'YES', 'p1c1/') ,
+                      ('p1c2', 2, 'YES', 'p1c2/') ]
 
     # perform eigenvalue perturbations
-    for comp in range(1,4):
-        print('\n\n =================== Performing ' + str(comp) + '  Component Perturbation =================== \n\n')
+    for label, comp, permute, folderName in perturbations:
+        print(f'\n\n =================== Performing {label} Component Perturbation =================== \n\n')
 
         # make copies
-        konfig = copy.deepcopy(config)
-        ztate  = copy.deepcopy(state)
+        konfig = pickle.loads(config_blob)
+        ztate  = pickle.loads(state_blob)
 
         # set componentality
         konfig.UQ_COMPONENT = comp
+        konfig.UQ_PERMUTE = permute
 
         # send output to a folder
-        folderName = str(comp)+'c/'
         if os.path.isdir(folderName):
-           shutil.rmtree(folderName)
+            shutil.rmtree(folderName)
         os.mkdir(folderName)
         sendOutputFiles(konfig, folderName)
 
@@ -95,59 +101,6 @@ def main():
         info = SU2.run.merge(konfig)
         ztate.update(info)
 
-
-    print('\n\n =================== Performing p1c1 Component Perturbation =================== \n\n')
-
-    # make copies
-    konfig = copy.deepcopy(config)
-    ztate  = copy.deepcopy(state)
-
-    # set componentality
-    konfig.UQ_COMPONENT = 1
-    konfig.UQ_PERMUTE = 'YES'
-
-    # send output to a folder
-    folderName = 'p1c1/'
-    if os.path.isdir(folderName):
-        shutil.rmtree(folderName)
-    os.mkdir(folderName)
-    sendOutputFiles(konfig, folderName)
-
-    # run su2
-    info = SU2.run.CFD(konfig)
-    ztate.update(info)
-
-    # Solution merging
-    konfig.SOLUTION_FILENAME = konfig.RESTART_FILENAME
-    info = SU2.run.merge(konfig)
-    state.update(info)
-
-    print('\n\n =================== Performing p1c2 Component Perturbation =================== \n\n')
-
-    # make copies
-    konfig = copy.deepcopy(config)
-    ztate  = copy.deepcopy(state)
-
-    # set componentality
-    konfig.UQ_COMPONENT = 2
-    konfig.UQ_PERMUTE = 'YES'
-
-    # send output to a folder
-    folderName = 'p1c2/'
-    if os.path.isdir(folderName):
-        shutil.rmtree(folderName)
-    os.mkdir(folderName)
-    sendOutputFiles(konfig, folderName)
-
-    # run su2
-    info = SU2.run.CFD(konfig)
-    ztate.update(info)
-
-    # Solution merging
-    konfig.SOLUTION_FILENAME = konfig.RESTART_FILENAME
-    info = SU2.run.merge(konfig)
-    ztate.update(info)
-
 def sendOutputFiles( config, folderName = ''):
     config.CONV_FILENAME = folderName + config.CONV_FILENAME
     #config.BREAKDOWN_FILENAME = folderName + config.BREAKDOWN_FILENAME